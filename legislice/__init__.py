@@ -1,11 +1,24 @@
 """Utility for downloading and comparing the text of statutes and constitutional provisions."""
 
+from typing import TYPE_CHECKING, Type
+
 from anchorpoint.textselectors import TextQuoteSelector, TextPositionSelector
 from anchorpoint.textselectors import TextPositionSet
 
 from legislice.enactments import Enactment
 from legislice.citations import Citation
-from legislice.download import Client
 from legislice.groups import EnactmentGroup
 
+if TYPE_CHECKING:
+    from legislice.download import Client
+
 __version__ = "0.8.1"
+
+
+def __getattr__(name: str) -> Type["Client"]:
+    """Import the download Client only when it is first requested."""
+    if name == "Client":
+        from legislice.download import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
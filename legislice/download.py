@@ -1,10 +1,18 @@
 """Download Enactments from API, with client."""
 
 import datetime
-from typing import Dict, List, Mapping, Optional, TypedDict, Union
+import hashlib
+import http.cookiejar
+import json
+from typing import Any, Dict, List, Mapping, Optional, TypedDict, Union
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from anchorpoint import TextPositionSelector
 
 from legislice.enactments import (
@@ -40,7 +48,7 @@ CONST_COVERAGE: PublicationCoverage = {
 
 def enactment_needs_api_update(data: RawEnactment) -> bool:
     """Determine if JSON representation of Enactment needs to be supplemented from API."""
-    if not isinstance(data, dict):
+    if not isinstance(data, Mapping):
         return False
     if not data.get("node"):
         raise ValueError(
@@ -73,6 +81,69 @@ class LegisliceTokenError(Exception):
     pass
 
 
+# How long responses stay in a Client's on-disk cache.
+CACHE_EXPIRATION = datetime.timedelta(days=7)
+
+
+def _cache_key(request: requests.PreparedRequest, **kwargs: Any) -> str:
+    """
+    Make a requests-cache key that depends on the request's API token.
+
+    requests-cache leaves the Authorization header out of its own keys, so
+    a hash of the header is added to keep each token's responses separate.
+    """
+    from requests_cache import create_key
+
+    token = request.headers.get("Authorization", "")
+    if isinstance(token, str):
+        token = token.encode()
+    token_hash = hashlib.sha256(token).hexdigest()[:16]
+    return f"{create_key(request, **kwargs)}-{token_hash}"
+
+
+def _make_session(cache_path: Optional[str] = None) -> requests.Session:
+    """
+    Create an HTTP session that never stores cookies.
+
+    If ``cache_path`` is given, successful responses are also cached in a
+    SQLite database at that path, keyed by URL and API token.
+    """
+    if cache_path is None:
+        session = requests.Session()
+    else:
+        try:
+            import requests_cache
+        except ImportError as error:
+            raise ImportError(
+                "Caching API responses with cache_path requires the requests-cache package."
+            ) from error
+        session = requests_cache.CachedSession(
+            cache_path,
+            backend="sqlite",
+            expire_after=CACHE_EXPIRATION,
+            key_fn=_cache_key,
+        )
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def loads_json(text: Union[str, bytes]) -> Any:
+    """Decode JSON text, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a response body, raising the same error as ``response.json()``."""
+    try:
+        return loads_json(response.content)
+    except json.JSONDecodeError as error:
+        raise requests.JSONDecodeError(
+            error.msg, error.doc, error.pos, response=response
+        ) from error
+
+
 def normalize_path(path: str) -> str:
     """Make sure path starts but does not end with a slash."""
     return "/" + path.strip("/")
@@ -81,13 +152,26 @@ def normalize_path(path: str) -> str:
 class Client:
     """Downloader for legislative text."""
 
+    # Shared by every Client, so all of them reuse the same pooled connections.
+    # Each request carries its own Authorization header, and no cookies are kept,
+    # so Clients with different API tokens can't see each other's credentials.
+    # Created when the first Client is, so importing legislice opens nothing.
+    _shared_session: Optional[requests.Session] = None
+
     def __init__(
         self,
         api_token: Optional[str] = "",
         api_root: Optional[str] = "https://authorityspoke.com/api/v1",
         update_coverage_from_api: bool = True,
+        cache_path: Optional[str] = None,
     ):
-        """Create download client with an API token and an API address."""
+        """
+        Create download client with an API token and an API address.
+
+        If ``cache_path`` is given, the Client gets its own session that
+        keeps API responses in a SQLite file at that path for
+        CACHE_EXPIRATION, so repeated queries don't reach the API.
+        """
         self.api_root = api_root or ""
 
         if api_token and api_token.startswith("Token "):
@@ -97,6 +181,12 @@ class Client:
             "/us/const": CONST_COVERAGE,
         }
         self.update_coverage_from_api = update_coverage_from_api
+        if cache_path is not None:
+            self._session = _make_session(cache_path=cache_path)
+        else:
+            if Client._shared_session is None:
+                Client._shared_session = _make_session()
+            self._session = Client._shared_session
 
     def fetch(
         self,
@@ -162,12 +252,12 @@ class Client:
                 target = target.split("@")[0]
             target = f"{target}@{date}"
 
-        return self._fetch_from_url(url=target).json()
+        return _response_json(self._fetch_from_url(url=target))
 
     def fetch_db_coverage(self, code_uri: str) -> PublicationCoverage:
         """Document date range of provisions of a code of laws available in API database."""
-        target = self.api_root + "/coverage" + code_uri
-        coverage = self._fetch_from_url(url=target).json()
+        target = f"{self.api_root}/coverage{code_uri}"
+        coverage = _response_json(self._fetch_from_url(url=target))
         for k, v in coverage.items():
             if k not in ("uri", "latest_heading"):
                 coverage[k] = datetime.date.fromisoformat(v)
@@ -212,15 +302,15 @@ class Client:
         self, path: str, date: Union[datetime.date, str] = ""
     ) -> str:
         """Generate URL for API call for specified USLM path and date."""
-        query_with_root = self.api_root + normalize_path(path)
+        path = normalize_path(path)
 
         if isinstance(date, datetime.date):
             date = date.isoformat()
         if date:
-            query_with_root = f"{query_with_root}@{date}"
-        elif not query_with_root.endswith("/"):
-            query_with_root += "/"
-        return query_with_root
+            return f"{self.api_root}{path}@{date}"
+        if path == "/":
+            return f"{self.api_root}/"
+        return f"{self.api_root}{path}/"
 
     def fetch_uri(
         self, query: str, date: Union[datetime.date, str] = ""
@@ -240,7 +330,7 @@ class Client:
         """
         url = self.url_from_enactment_path(path=query, date=date)
         response = self._fetch_from_url(url=url)
-        return response.json()
+        return _response_json(response)
 
     def uri_from_query(self, target: Union[str, Enactment, CrossReference]) -> str:
         """Get a URI for the target object."""
@@ -264,9 +354,9 @@ class Client:
             a list of dicts representing citations to the cited node
         """
         uri = self.uri_from_query(target)
-        query_with_root = self.api_root + "/citations_to" + uri
+        query_with_root = f"{self.api_root}/citations_to{uri}"
         api_response = self._fetch_from_url(query_with_root)
-        return api_response.json()["results"]
+        return _response_json(api_response)["results"]
 
     def citations_to(
         self, target: Union[str, Enactment, CrossReference]
@@ -285,7 +375,7 @@ class Client:
         json_citations = self.fetch_citations_to(target_uri)
         for entry in json_citations:
             entry["target_uri"] = target_uri
-        return [InboundReference(**data) for data in json_citations]
+        return [InboundReference.model_validate(data) for data in json_citations]
 
     def update_data_from_api_if_needed(self, data: RawEnactment) -> RawEnactment:
         """
@@ -295,7 +385,8 @@ class Client:
             a dict representing the data from the API
 
         :returns:
-            a dict representing the data from the API with updated data from API coverage
+            a dict representing the data from the API with updated data from API coverage.
+            The dict passed in is not changed.
         """
         if enactment_needs_api_update(data):
             data = self.update_enactment_from_api(data)
@@ -303,8 +394,11 @@ class Client:
         # update client's data about the database's coverage
         code_uri = self.get_db_coverage(data["node"])
         if self.coverage.get(code_uri):
-            data["earliest_in_db"] = self.coverage[code_uri]["earliest_in_db"]
-            data["first_published"] = self.coverage[code_uri]["first_published"]
+            data = {
+                **data,
+                "earliest_in_db": self.coverage[code_uri]["earliest_in_db"],
+                "first_published": self.coverage[code_uri]["first_published"],
+            }
         return data
 
     def read_passage_from_json(self, data: RawEnactmentPassage) -> EnactmentPassage:
@@ -314,22 +408,31 @@ class Client:
         If fields are missing from the JSON, they will be fetched using the API key.
         """
 
-        data["enactment"] = self.update_data_from_api_if_needed(data=data["enactment"])
+        data = {
+            **data,
+            "enactment": self.update_data_from_api_if_needed(data=data["enactment"]),
+        }
 
-        return EnactmentPassage(**data)
+        return EnactmentPassage.model_validate(data)
 
     def read_from_json(
-        self, data: RawEnactment, use_text_expansion: bool = True
+        self,
+        data: Union[RawEnactment, str, bytes],
+        use_text_expansion: bool = True,
     ) -> Enactment:
         r"""
         Create a new :class:`Enactment` object using imported JSON data.
 
         If fields are missing from the JSON, they will be fetched using the API key.
-        """
 
-        data = self.update_data_from_api_if_needed(data=data)
+        :param data:
+            a dict representing an Enactment, or the same data as undecoded
+            JSON text. Dicts are validated directly without being re-serialized.
+        """
+        raw: RawEnactment = loads_json(data) if isinstance(data, (str, bytes)) else data
+        raw = self.update_data_from_api_if_needed(data=raw)
 
-        return Enactment(**data)
+        return Enactment.model_validate(raw)
 
     def read(
         self,
@@ -389,7 +492,7 @@ class Client:
 
         url = url.rstrip("/") + "/"
 
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         if response.status_code == 404:
             raise LegislicePathError(f"No enacted text found for query {url}")
         if response.status_code == 403:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from copy import deepcopy
 
 from datetime import date
-from typing import Sequence, List, Optional, Tuple, Union
+from typing import Iterator, Sequence, List, Optional, Tuple, Union
 
 from anchorpoint import TextQuoteSelector, TextPositionSelector
 from anchorpoint.textselectors import TextPositionSet, TextSelectionError
@@ -15,7 +15,7 @@ from anchorpoint.textsequences import TextSequence
 from legislice.citations import Citation, identify_code, CodeLevel
 from legislice.types import InboundReferenceDict
 
-from pydantic import field_validator, model_validator, BaseModel
+from pydantic import field_validator, model_validator, BaseModel, Field
 from ranges import Range, RangeDict
 
 
@@ -196,10 +196,10 @@ class Enactment(BaseModel):
     earliest_in_db: Optional[date] = None
     anchors: Union[
         TextPositionSet, List[Union[TextPositionSelector, TextQuoteSelector]]
-    ] = []
-    citations: List[CrossReference] = []
+    ] = Field(default_factory=list)
+    citations: List[CrossReference] = Field(default_factory=list)
     name: str = ""
-    children: Union[List[Enactment], List[str]] = []
+    children: Union[List[Enactment], List[str]] = Field(default_factory=list)
 
     @field_validator("text_version", mode="before")
     @classmethod
@@ -223,6 +223,8 @@ class Enactment(BaseModel):
     @property
     def nested_children(self):
         """Get nested children attribute."""
+        if not self.children:
+            return []
         return [child for child in self.children if isinstance(child, Enactment)]
 
     def get_identifier_part(self, index: int) -> Optional[str]:
@@ -309,12 +311,17 @@ class Enactment(BaseModel):
             revision_date=revision_date,
         )
 
+    def _walk(self) -> Iterator[Enactment]:
+        """Yield this node and all nested nodes in text order, without recursion."""
+        stack: List[Enactment] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.nested_children))
+
     def cross_references(self) -> List[CrossReference]:
         """Return all cross-references from this node and subnodes."""
-        result = self.citations[:]
-        for child in self.nested_children:
-            result += child.cross_references()
-        return result
+        return [citation for node in self._walk() for citation in node.citations]
 
     def get_string(
         self,
@@ -384,6 +391,8 @@ class Enactment(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
+        if self is other:
+            return True
         self_selected_passages = self.text_sequence()
         other_selected_passages = other.text_sequence()
         return self_selected_passages.means(other_selected_passages)
@@ -455,32 +464,21 @@ class Enactment(BaseModel):
             positions=TextPositionSelector(start=0, end=len(self.content))
         )
 
-    def _rangedict(
-        self, range_dict: RangeDict, tree_length: int
-    ) -> Tuple[RangeDict, int]:
-        if self.content:
-            span = Range(start=tree_length, end=tree_length + len(self.content))
-            range_dict[span] = EnactmentMemo(
-                node=self.node,
-                start_date=self.start_date,
-                content=self.content,
-                end_date=self.end_date,
-            )
-        new_tree_length = tree_length + self.padded_length
-
-        for child in self.nested_children:
-            range_dict, new_tree_length = child._rangedict(
-                range_dict=range_dict, tree_length=new_tree_length
-            )
-
-        return range_dict, new_tree_length
-
     def rangedict(self) -> RangeDict:
         """Return a RangeDict matching text spans to Enactment attributes."""
-        new_range_dict, new_tree_length = self._rangedict(
-            range_dict=RangeDict(), tree_length=0
-        )
-        return new_range_dict
+        range_dict = RangeDict()
+        tree_length = 0
+        for node in self._walk():
+            if node.content:
+                span = Range(start=tree_length, end=tree_length + len(node.content))
+                range_dict[span] = EnactmentMemo(
+                    node=node.node,
+                    start_date=node.start_date,
+                    content=node.content,
+                    end_date=node.end_date,
+                )
+            tree_length += node.padded_length
+        return range_dict
 
     @property
     def span_length(self) -> int:
@@ -489,27 +487,15 @@ class Enactment(BaseModel):
             child.span_length for child in self.nested_children
         )
 
-    def _tree_selection(
-        self, selector_set: TextPositionSet, tree_length: int
-    ) -> Tuple[TextPositionSet, int]:
-        selectors_at_node = self.make_selection_of_this_node()
-        selectors_at_node_with_offset = selectors_at_node + tree_length
-        new_tree_length = tree_length + self.padded_length
-        new_selector_set = selector_set + selectors_at_node_with_offset
-
-        for child in self.nested_children:
-            new_selector_set, new_tree_length = child._tree_selection(
-                selector_set=new_selector_set, tree_length=new_tree_length
-            )
-
-        return new_selector_set, new_tree_length
-
     def tree_selection(self) -> TextPositionSet:
         """Return set of selectors for selected text in this provision and its children."""
-        new_selector_set, new_tree_length = self._tree_selection(
-            selector_set=TextPositionSet(), tree_length=0
-        )
-        return new_selector_set
+        selector_set = TextPositionSet()
+        tree_length = 0
+        for node in self._walk():
+            selectors_at_node = node.make_selection_of_this_node()
+            selector_set = selector_set + (selectors_at_node + tree_length)
+            tree_length += node.padded_length
+        return selector_set
 
     def csl_json(self) -> str:
         """
@@ -532,8 +518,9 @@ class Enactment(BaseModel):
         text_parts = [self.content]
 
         for child in self.nested_children:
-            if child.text:
-                text_parts.append(child.text)
+            child_text = child.text
+            if child_text:
+                text_parts.append(child_text)
         joined = " ".join(text_parts)
         return joined.strip()
 
@@ -543,6 +530,8 @@ class Enactment(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
+        if self is other:
+            return True
         self_selected_passages = self.text_sequence(include_nones=False)
         other_selected_passages = other.text_sequence(include_nones=False)
         return self_selected_passages >= other_selected_passages
@@ -634,8 +623,9 @@ class EnactmentPassage(BaseModel):
         """Get the latest start date of any provision version included in the passage."""
         current = self.enactment.start_date
         ranges = self.enactment.rangedict()
+        selected = self.selection.rangeset()
         for span, memo in ranges.items():
-            if self.selection.rangeset() & span[0]:
+            if selected & span[0]:
                 if memo.start_date > current:
                     current = memo.start_date
         return current
@@ -645,8 +635,9 @@ class EnactmentPassage(BaseModel):
         """Get the earliest end date of any provision version included in the passage."""
         current = self.enactment.end_date
         ranges = self.enactment.rangedict()
+        selected = self.selection.rangeset()
         for span, memo in ranges.items():
-            if self.selection.rangeset() & span[0]:
+            if selected & span[0]:
                 if not current:
                     current = memo.end_date
                 elif memo.end_date and memo.end_date < current:
@@ -731,6 +722,8 @@ class EnactmentPassage(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
+        if self is other:
+            return True
         self_selected_passages = self.text_sequence(include_nones=False)
         other_selected_passages = other.text_sequence(include_nones=False)
         return self_selected_passages >= other_selected_passages
@@ -880,6 +873,8 @@ class EnactmentPassage(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
+        if self is other:
+            return True
         self_selected_passages = self.text_sequence()
         other_selected_passages = other.text_sequence()
         return self_selected_passages.means(other_selected_passages)
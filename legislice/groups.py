@@ -6,7 +6,7 @@ import textwrap
 from typing import List, Sequence, Union
 
 from legislice.enactments import Enactment, EnactmentPassage, consolidate_enactments
-from pydantic import field_validator, BaseModel
+from pydantic import field_validator, BaseModel, Field
 
 
 def sort_passages(passages: List[EnactmentPassage]) -> List[EnactmentPassage]:
@@ -25,7 +25,7 @@ def sort_passages(passages: List[EnactmentPassage]) -> List[EnactmentPassage]:
 class EnactmentGroup(BaseModel):
     """Group of Enactments with comparison methods."""
 
-    passages: List[EnactmentPassage] = []
+    passages: List[EnactmentPassage] = Field(default_factory=list)
 
     @field_validator("passages", mode="before")
     @classmethod
@@ -1,614 +1,316 @@
 import datetime
+from functools import lru_cache
+import json
 import os
-from typing import Dict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-from anchorpoint import TextQuoteSelector
 from dotenv import load_dotenv
 import pytest
 
 from legislice.download import Client
+from legislice.enactments import Enactment
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 API_ROOT = "https://authorityspoke.com/api/v1"
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BILL_OF_RIGHTS_DATE = "1791-12-15"
 
 
-@pytest.fixture(scope="module")
-def vcr_config():
+def _freeze(obj: Any) -> Any:
+    """Convert nested dicts and lists to read-only mappings and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _leaf(
+    node: str, text_id: int, content: str, start_date: str, heading: str = ""
+) -> Dict[str, Any]:
+    """Build the raw API response for a provision with text and no subsections."""
+    parent = node.rsplit("/", 1)[0]
     return {
-        # Replace the Authorization request header with "DUMMY" in cassettes
-        "filter_headers": [("authorization", "DUMMY")],
+        "heading": heading,
+        "start_date": start_date,
+        "node": node,
+        "text_version": {
+            "id": text_id,
+            "url": f"{API_ROOT}/textversions/{text_id}/",
+            "content": content,
+        },
+        "url": f"{API_ROOT}{node}/",
+        "end_date": None,
+        "children": [],
+        "citations": [],
+        "parent": f"{API_ROOT}{parent}/",
+    }
+
+
+@lru_cache(maxsize=None)
+def _load_fixture(filename: str) -> Any:
+    """Parse a JSON file from the fixtures directory, once per run."""
+    raw = (FIXTURES_DIR / filename).read_bytes()
+    if orjson is not None:
+        return _freeze(orjson.loads(raw))
+    return _freeze(json.loads(raw))
+
+
+# Session-scoped fixtures that return raw data are shared by every test
+# in the run, so they are frozen with _freeze(). Copy one into a new dict
+# before changing it.
+
+
+_RECORDED_RESPONSE_HEADERS = frozenset({"content-type", "content-length", "location"})
+
+
+def _drop_response_headers(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the response headers that requests needs to replay a response."""
+    response["headers"] = {
+        name: value
+        for name, value in response["headers"].items()
+        if name.lower() in _RECORDED_RESPONSE_HEADERS
     }
+    return response
 
 
-@pytest.fixture(scope="class")
-def test_client() -> Client:
-    client = Client(api_token=TOKEN)
-    client.coverage["/us/usc"] = {
+_VCR_CONFIG = {
+    # Replace the Authorization request header with "DUMMY" in cassettes
+    "filter_headers": (("authorization", "DUMMY"),),
+    "before_record_response": _drop_response_headers,
+    "decode_compressed_response": True,
+    # JSON cassettes load much faster than YAML ones
+    "serializer": "json",
+}
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    return _VCR_CONFIG
+
+
+_COVERAGE = {
+    "/us/usc": {
         "latest_heading": "United States Code (USC)",
         "first_published": datetime.date(1926, 6, 30),
         "earliest_in_db": datetime.date(2013, 7, 18),
         "latest_in_db": datetime.date(2020, 8, 8),
-    }
-    client.coverage["/test/acts"] = {
+    },
+    "/test/acts": {
         "latest_heading": "Test Acts",
         "first_published": datetime.date(1935, 4, 1),
         "earliest_in_db": datetime.date(1935, 4, 1),
         "latest_in_db": datetime.date(2013, 7, 18),
-    }
+    },
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_env() -> None:
+    """Read environment variables from a .env file, once per run."""
+    load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def api_token(_load_env) -> Optional[str]:
+    return os.getenv("LEGISLICE_API_TOKEN")
+
+
+@pytest.fixture(autouse=True)
+def _skip_recording_without_token(request, api_token) -> None:
+    """
+    Skip VCR tests that would record cassettes without an API token.
+
+    Tests whose cassette already exists still replay it, unless the
+    record mode rewrites every cassette.
+    """
+    if api_token or request.node.get_closest_marker("vcr") is None:
+        return
+    record_mode = request.config.getoption("--record-mode", default="none")
+    if record_mode == "none":
+        return
+    if record_mode not in ("all", "rewrite"):
+        cassette_dir = Path(request.getfixturevalue("vcr_cassette_dir"))
+        cassette_name = request.getfixturevalue("default_cassette_name")
+        if (cassette_dir / f"{cassette_name}.{_VCR_CONFIG['serializer']}").exists():
+            return
+    pytest.skip("Set LEGISLICE_API_TOKEN to record new cassettes.")
+
+
+@pytest.fixture(scope="session")
+def test_client(api_token) -> Client:
+    client = Client(api_token=api_token)
+    client.coverage.update(_COVERAGE)
     return client
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
+def live_client(api_token):
+    """Client without preloaded coverage data."""
+    return Client(api_token=api_token, api_root=API_ROOT)
+
+
+@pytest.fixture
+def read(test_client) -> Callable[..., Enactment]:
+    """
+    Read an Enactment with test_client, once per test for each query and date.
+
+    Nothing is shared between tests, so every request a test makes is
+    answered from that test's own VCR cassette.
+    """
+    downloads: Dict[Tuple[str, str], Enactment] = {}
+
+    def _read(query: str, date: str = "") -> Enactment:
+        key = (query, date)
+        if key not in downloads:
+            downloads[key] = test_client.read(query=query, date=date)
+        return downloads[key]
+
+    return _read
+
+
+@pytest.fixture
+def infringement_statute(read) -> Enactment:
+    """Read 17 U.S.C. § 501 with the read fixture."""
+    return read("/us/usc/t17/s501")
+
+
+@pytest.fixture
+def citations_to_s501(test_client):
+    return test_client.citations_to("/us/usc/t17/s501")
+
+
+@pytest.fixture(scope="session")
 def section6d():
-    return {
-        "heading": "Waiver of beard tax in special circumstances",
-        "content": "",
-        "children": [
-            {
-                "heading": "",
-                "content": "The Department of Beards shall waive the collection of beard tax upon issuance of beardcoin under Section 6C where the reason the maintainer wears a beard is due to bona fide religious, cultural, or medical reasons.",
-                "children": [],
-                "end_date": None,
-                "node": "/test/acts/47/6D/1",
-                "start_date": "2013-07-18",
-                "url": "http://127.0.0.1:8000/api/v1/test/acts/47/6D/1@2018-03-11/",
-            },
-            {
-                "heading": "",
-                "content": "The determination of the Department of Beards as to what constitutes bona fide religious or cultural reasons shall be final and no right of appeal shall exist.",
-                "children": [],
-                "end_date": None,
-                "node": "/test/acts/47/6D/2",
-                "start_date": "1935-04-01",
-                "url": "http://127.0.0.1:8000/api/v1/test/acts/47/6D/2@2018-03-11/",
-            },
-        ],
-        "end_date": None,
-        "node": "/test/acts/47/6D",
-        "start_date": "1935-04-01",
-        "url": "http://127.0.0.1:8000/api/v1/test/acts/47/6D@2018-03-11/",
-        "parent": "http://127.0.0.1:8000/api/v1/test/acts/47@2018-03-11/",
-    }
+    return _load_fixture("section6d.json")
 
 
-@pytest.fixture()
-def section_8():
-    return {
-        "heading": "Notice to remedy",
-        "start_date": "1935-04-01",
-        "node": "/test/acts/47/8",
-        "text_version": None,
-        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/",
-        "end_date": None,
-        "children": [
-            {
-                "heading": "",
-                "start_date": "1935-04-01",
-                "node": "/test/acts/47/8/1",
-                "text_version": {
-                    "id": 1142679,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142679/",
-                    "content": "Where an officer of the Department of Beards, Australian Federal Police, state or territorial police, or military police of the Australian Defence Force finds a person to be wearing a beard within the territory of the Commonwealth of Australia, and that person fails or is unable to produce a beardcoin as proof of holding an exemption under section 6, that officer shall in the first instance issue such person a notice to remedy.",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/8/1/",
-                "end_date": None,
-                "children": [],
-                "citations": [
-                    {
-                        "target_uri": "/test/acts/47/6",
-                        "target_url": "https://authorityspoke.com/api/v1/test/acts/47/6/",
-                        "target_node": 1386965,
-                        "reference_text": "section 6",
-                    }
-                ],
-            },
-            {
-                "heading": "",
-                "start_date": "1935-04-01",
-                "node": "/test/acts/47/8/2",
-                "text_version": {
-                    "id": 1142683,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142683/",
-                    "content": "Any such person issued a notice to remedy under subsection 1 must either:",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/",
-                "end_date": None,
-                "children": [
-                    {
-                        "heading": "",
-                        "start_date": "1935-04-01",
-                        "node": "/test/acts/47/8/2/a",
-                        "text_version": {
-                            "id": 1142680,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142680/",
-                            "content": "shave in such a way that they are no longer in breach of section 5, or",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/a/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [
-                            {
-                                "target_uri": "/test/acts/47/5",
-                                "target_url": "https://authorityspoke.com/api/v1/test/acts/47/5/",
-                                "target_node": 1386964,
-                                "reference_text": "section 5",
-                            }
-                        ],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "2013-07-18",
-                        "node": "/test/acts/47/8/2/b",
-                        "text_version": {
-                            "id": 1142702,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142702/",
-                            "content": "remove the beard with electrolysis, or",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/b/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "2013-07-18",
-                        "node": "/test/acts/47/8/2/b-con",
-                        "text_version": None,
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/b-con/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "2013-07-18",
-                        "node": "/test/acts/47/8/2/c",
-                        "text_version": {
-                            "id": 1142703,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142703/",
-                            "content": "remove the beard with a laser, or",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/c/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "2013-07-18",
-                        "node": "/test/acts/47/8/2/d",
-                        "text_version": {
-                            "id": 1142681,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142681/",
-                            "content": "obtain a beardcoin from the Department of Beards",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/d/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "2013-07-18",
-                        "node": "/test/acts/47/8/2/d-con",
-                        "text_version": {
-                            "id": 1142682,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142682/",
-                            "content": "within 14 days of such notice being issued to them.",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/d-con/",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [],
-                    },
-                ],
-                "citations": [
-                    {
-                        "target_uri": "/test/acts/47/8/1",
-                        "target_url": "https://authorityspoke.com/api/v1/test/acts/47/8/1/",
-                        "target_node": 1386980,
-                        "reference_text": "subsection 1",
-                    }
-                ],
-            },
-        ],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/test/acts/47/",
-    }
+@pytest.fixture(scope="session")
+def section6d_enactment(section6d, test_client):
+    return test_client.read_from_json(section6d)
 
 
-@pytest.fixture()
-def old_section_8():
-    return {
-        "heading": "Notice to remedy",
-        "start_date": "1935-04-01",
-        "node": "/test/acts/47/8",
-        "text_version": None,
-        "url": "https://authorityspoke.com/api/v1/test/acts/47/8@1935-04-01",
-        "end_date": None,
-        "children": [
-            {
-                "heading": "",
-                "start_date": "1935-04-01",
-                "node": "/test/acts/47/8/1",
-                "text_version": {
-                    "id": 1142679,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142679/",
-                    "content": "Where an officer of the Department of Beards, Australian Federal Police, state or territorial police, or military police of the Australian Defence Force finds a person to be wearing a beard within the territory of the Commonwealth of Australia, and that person fails or is unable to produce a beardcoin as proof of holding an exemption under section 6, that officer shall in the first instance issue such person a notice to remedy.",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/8/1@1935-04-01",
-                "end_date": None,
-                "children": [],
-                "citations": [
-                    {
-                        "target_uri": "/test/acts/47/6",
-                        "target_url": "https://authorityspoke.com/api/v1/test/acts/47/6@1935-04-01",
-                        "target_node": 1386965,
-                        "reference_text": "section 6",
-                    }
-                ],
-            },
-            {
-                "heading": "",
-                "start_date": "1935-04-01",
-                "node": "/test/acts/47/8/2",
-                "text_version": {
-                    "id": 1142683,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142683/",
-                    "content": "Any such person issued a notice to remedy under subsection 1 must either:",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2@1935-04-01",
-                "end_date": None,
-                "children": [
-                    {
-                        "heading": "",
-                        "start_date": "1935-04-01",
-                        "node": "/test/acts/47/8/2/a",
-                        "text_version": {
-                            "id": 1142680,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142680/",
-                            "content": "shave in such a way that they are no longer in breach of section 5, or",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/a@1935-04-01",
-                        "end_date": None,
-                        "children": [],
-                        "citations": [
-                            {
-                                "target_uri": "/test/acts/47/5",
-                                "target_url": "https://authorityspoke.com/api/v1/test/acts/47/5@1935-04-01",
-                                "target_node": 1386964,
-                                "reference_text": "section 5",
-                            }
-                        ],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "1935-04-01",
-                        "node": "/test/acts/47/8/2/b",
-                        "text_version": {
-                            "id": 1142681,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142681/",
-                            "content": "obtain a beardcoin from the Department of Beards",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/b@1935-04-01",
-                        "end_date": "2013-07-18",
-                        "children": [],
-                        "citations": [],
-                    },
-                    {
-                        "heading": "",
-                        "start_date": "1935-04-01",
-                        "node": "/test/acts/47/8/2/b-con",
-                        "text_version": {
-                            "id": 1142682,
-                            "url": "https://authorityspoke.com/api/v1/textversions/1142682/",
-                            "content": "within 14 days of such notice being issued to them.",
-                        },
-                        "url": "https://authorityspoke.com/api/v1/test/acts/47/8/2/b-con@1935-04-01",
-                        "end_date": "2013-07-18",
-                        "children": [],
-                        "citations": [],
-                    },
-                ],
-                "citations": [
-                    {
-                        "target_uri": "/test/acts/47/8/1",
-                        "target_url": "https://authorityspoke.com/api/v1/test/acts/47/8/1@1935-04-01",
-                        "target_node": 1386980,
-                        "reference_text": "subsection 1",
-                    }
-                ],
-            },
-        ],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/test/acts/47@1935-04-01",
-    }
+@pytest.fixture(scope="session")
+def section6d_citation(section6d_enactment):
+    return section6d_enactment.as_citation()
 
 
-@pytest.fixture(scope="class")
-def section_11_together():
-    return {
-        "heading": "Licensed repurchasers of beardcoin",
-        "text_version": {
-            "id": 1142710,
-            "url": "https://authorityspoke.com/api/v1/textversions/1142710/",
-            "content": "The Department of Beards may issue licenses to such barbers, hairdressers, or other male grooming professionals as they see fit to purchase a beardcoin from a customer whose beard they have removed, and to resell those beardcoins to the Department of Beards.",
-        },
-        "children": [],
-        "end_date": "2013-07-18",
-        "node": "/test/acts/47/11",
-        "start_date": "1935-04-01",
-        "url": "https://authorityspoke.com/api/v1/test/acts/47/11@1999-01-01",
-        "parent": "https://authorityspoke.com/api/v1/test/acts/47@1999-01-01",
-    }
+@pytest.fixture(scope="session")
+def section_8():
+    return _load_fixture("section_8.json")
 
 
-@pytest.fixture(scope="class")
-def citation_to_6c():
-    return {
-        "target_uri": "/test/acts/47/6C",
-        "target_url": f"{API_ROOT}/test/acts/47/6C@1940-01-01",
-        "target_node": 1660695,
-        "reference_text": "Section 6C",
-    }
+@pytest.fixture(scope="session")
+def old_section_8():
+    return _load_fixture("old_section_8.json")
 
 
-@pytest.fixture(scope="function")
-def section_11_subdivided():
-    return {
-        "heading": "Licensed repurchasers of beardcoin",
-        "start_date": "2013-07-18",
-        "node": "/test/acts/47/11",
-        "text_version": {
-            "id": 1142710,
-            "url": "https://authorityspoke.com/api/v1/textversions/1142710/",
-            "content": "The Department of Beards may issue licenses to such",
-        },
-        "url": "https://authorityspoke.com/api/v1/test/acts/47/11/",
-        "end_date": None,
-        "children": [
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/i",
-                "text_version": {
-                    "id": 1142704,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142704/",
-                    "content": "barbers,",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/i/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/ii",
-                "text_version": {
-                    "id": 1142705,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142705/",
-                    "content": "hairdressers, or",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/ii/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/iii",
-                "text_version": {
-                    "id": 1142706,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142706/",
-                    "content": "other male grooming professionals",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/iii/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/iii-con",
-                "text_version": {
-                    "id": 1142707,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142707/",
-                    "content": "as they see fit to purchase a beardcoin from a customer",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/iii-con/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/iv",
-                "text_version": {
-                    "id": 1142708,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142708/",
-                    "content": "whose beard they have removed,",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/iv/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-            {
-                "heading": "",
-                "start_date": "2013-07-18",
-                "node": "/test/acts/47/11/iv-con",
-                "text_version": {
-                    "id": 1142709,
-                    "url": "https://authorityspoke.com/api/v1/textversions/1142709/",
-                    "content": "and to resell those beardcoins to the Department of Beards.",
-                },
-                "url": "https://authorityspoke.com/api/v1/test/acts/47/11/iv-con/",
-                "end_date": None,
-                "children": [],
-                "citations": [],
-            },
-        ],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/test/acts/47/",
-    }
+@pytest.fixture(scope="session")
+def section_11_together():
+    return _load_fixture("section_11_together.json")
 
 
-@pytest.fixture(scope="module")
-def make_selector() -> Dict[str, TextQuoteSelector]:
-    return {
-        "bad_selector": TextQuoteSelector(exact="text that doesn't exist in the code"),
-        "preexisting material": TextQuoteSelector(
-            exact=(
-                "protection for a work employing preexisting material in which "
-                + "copyright subsists does not extend to any part of the work in "
-                + "which such material has been used unlawfully."
-            )
-        ),
-        "copyright": TextQuoteSelector(suffix="idea, procedure,"),
-        "copyright_requires_originality": TextQuoteSelector(
-            suffix="fixed in any tangible"
-        ),
-    }
+@pytest.fixture(scope="session")
+def section_11_together_enactment(section_11_together):
+    return Enactment(**section_11_together)
 
 
-@pytest.fixture(scope="class")
-def first_a(test_client):
-    return test_client.read_from_json(
+@pytest.fixture(scope="session")
+def citation_to_6c():
+    return _freeze(
         {
-            "heading": "AMENDMENT I.",
-            "start_date": "1791-12-15",
-            "node": "/us/const/amendment/I",
-            "text_version": {
-                "id": 735703,
-                "url": "https://authorityspoke.com/api/v1/textversions/735703/",
-                "content": "Congress shall make no law respecting an establishment of religion, or prohibiting the free exercise thereof; or abridging the freedom of speech, or of the press; or the right of the people peaceably to assemble, and to petition the Government for a redress of grievances.",
-            },
-            "url": "https://authorityspoke.com/api/v1/us/const/amendment/I/",
-            "end_date": None,
-            "children": [],
-            "citations": [],
-            "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
+            "target_uri": "/test/acts/47/6C",
+            "target_url": f"{API_ROOT}/test/acts/47/6C@1940-01-01",
+            "target_node": 1660695,
+            "reference_text": "Section 6C",
         }
     )
 
 
-@pytest.fixture(scope="class")
-def second_a(test_client):
-    return test_client.read_from_json(
-        {
-            "heading": "AMENDMENT II.",
-            "start_date": "1791-12-15",
-            "node": "/us/const/amendment/II",
-            "text_version": {
-                "id": 735704,
-                "url": "https://authorityspoke.com/api/v1/textversions/735704/",
-                "content": "A well regulated Militia being necessary to the security of a free State, the right of the people to keep and bear arms, shall not be infringed.",
-            },
-            "url": "https://authorityspoke.com/api/v1/us/const/amendment/II/",
-            "end_date": None,
-            "children": [],
-            "citations": [],
-            "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
-        }
-    )
+@pytest.fixture(scope="session")
+def section_11_subdivided():
+    return _load_fixture("section_11_subdivided.json")
 
 
-@pytest.fixture(scope="class")
-def third_a(test_client):
-    return test_client.read_from_json(
-        {
-            "heading": "AMENDMENT III.",
-            "start_date": "1791-12-15",
-            "node": "/us/const/amendment/III",
-            "text_version": {
-                "id": 735705,
-                "url": "https://authorityspoke.com/api/v1/textversions/735705/",
-                "content": "No soldier shall, in time of peace be quartered in any house, without the consent of the Owner, nor in time of war, but in a manner to be prescribed by law.",
-            },
-            "url": "https://authorityspoke.com/api/v1/us/const/amendment/III/",
-            "end_date": None,
-            "children": [],
-            "citations": [],
-            "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
-        }
-    )
+@pytest.fixture(scope="session")
+def section_11_subdivided_enactment(section_11_subdivided):
+    return Enactment(**section_11_subdivided)
 
 
-@pytest.fixture(scope="class")
-def fourth_a():
-    return {
-        "heading": "AMENDMENT IV.",
-        "start_date": "1791-12-15",
-        "node": "/us/const/amendment/IV",
-        "text_version": {
-            "id": 735706,
-            "url": "https://authorityspoke.com/api/v1/textversions/735706/",
-            "content": "The right of the people to be secure in their persons, houses, papers, and effects, against unreasonable searches and seizures, shall not be violated, and no Warrants shall issue, but upon probable cause, supported by Oath or affirmation, and particularly describing the place to be searched, and the persons or things to be seized.",
-        },
-        "url": "https://authorityspoke.com/api/v1/us/const/amendment/IV/",
-        "end_date": None,
-        "children": [],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
+_AMENDMENTS = _freeze(
+    {
+        "I": _leaf(
+            node="/us/const/amendment/I",
+            heading="AMENDMENT I.",
+            start_date=BILL_OF_RIGHTS_DATE,
+            text_id=735703,
+            content="Congress shall make no law respecting an establishment of religion, or prohibiting the free exercise thereof; or abridging the freedom of speech, or of the press; or the right of the people peaceably to assemble, and to petition the Government for a redress of grievances.",
+        ),
+        "II": _leaf(
+            node="/us/const/amendment/II",
+            heading="AMENDMENT II.",
+            start_date=BILL_OF_RIGHTS_DATE,
+            text_id=735704,
+            content="A well regulated Militia being necessary to the security of a free State, the right of the people to keep and bear arms, shall not be infringed.",
+        ),
+        "III": _leaf(
+            node="/us/const/amendment/III",
+            heading="AMENDMENT III.",
+            start_date=BILL_OF_RIGHTS_DATE,
+            text_id=735705,
+            content="No soldier shall, in time of peace be quartered in any house, without the consent of the Owner, nor in time of war, but in a manner to be prescribed by law.",
+        ),
+        "IV": _leaf(
+            node="/us/const/amendment/IV",
+            heading="AMENDMENT IV.",
+            start_date=BILL_OF_RIGHTS_DATE,
+            text_id=735706,
+            content="The right of the people to be secure in their persons, houses, papers, and effects, against unreasonable searches and seizures, shall not be violated, and no Warrants shall issue, but upon probable cause, supported by Oath or affirmation, and particularly describing the place to be searched, and the persons or things to be seized.",
+        ),
+        "V": _leaf(
+            node="/us/const/amendment/V",
+            heading="AMENDMENT V.",
+            start_date=BILL_OF_RIGHTS_DATE,
+            text_id=735707,
+            content="No person shall be held to answer for a capital, or otherwise infamous crime, unless on a presentment or indictment of a Grand Jury, except in cases arising in the land or naval forces, or in the Militia, when in actual service in time of War or public danger; nor shall any person be subject for the same offence to be twice put in jeopardy of life or limb; nor shall be compelled in any Criminal Case to be a witness against himself; nor be deprived of life, liberty, or property, without due process of law; nor shall private property be taken for public use, without just compensation.",
+        ),
+        "XIV/1": _leaf(
+            node="/us/const/amendment/XIV/1",
+            heading="Citizenship: security and equal protection of citizens.",
+            start_date="1868-07-28",
+            text_id=735717,
+            content="All persons born or naturalized in the United States, and subject to the jurisdiction thereof, are citizens of the United States and of the State wherein they reside. No State shall make or enforce any law which shall abridge the privileges or immunities of citizens of the United States; nor shall any State deprive any person of life, liberty, or property, without due process of law; nor deny to any person within its jurisdiction the equal protection of the laws.",
+        ),
     }
+)
+
+
+@pytest.fixture(scope="session")
+def amendments(test_client) -> Mapping[str, Enactment]:
+    """Load each constitutional amendment in _AMENDMENTS, once per session."""
+    return MappingProxyType(
+        {label: test_client.read_from_json(data) for label, data in _AMENDMENTS.items()}
+    )
 
 
 @pytest.fixture(scope="module")
 def fourth_a_no_text_version():
     return {
         "heading": "AMENDMENT IV.",
-        "start_date": "1791-12-15",
+        "start_date": BILL_OF_RIGHTS_DATE,
         "node": "/us/const/amendment/IV",
         "content": "The right of the people to be secure in their persons, houses, papers, and effects, against unreasonable searches and seizures, shall not be violated, and no Warrants shall issue, but upon probable cause, supported by Oath or affirmation, and particularly describing the place to be searched, and the persons or things to be seized.",
-        "url": "https://authorityspoke.com/api/v1/us/const/amendment/IV/",
+        "url": f"{API_ROOT}/us/const/amendment/IV/",
         "end_date": None,
         "children": [],
         "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
-    }
-
-
-@pytest.fixture(scope="module")
-def fifth_a():
-    return {
-        "heading": "AMENDMENT V.",
-        "start_date": "1791-12-15",
-        "node": "/us/const/amendment/V",
-        "text_version": {
-            "id": 735707,
-            "url": "https://authorityspoke.com/api/v1/textversions/735707/",
-            "content": "No person shall be held to answer for a capital, or otherwise infamous crime, unless on a presentment or indictment of a Grand Jury, except in cases arising in the land or naval forces, or in the Militia, when in actual service in time of War or public danger; nor shall any person be subject for the same offence to be twice put in jeopardy of life or limb; nor shall be compelled in any Criminal Case to be a witness against himself; nor be deprived of life, liberty, or property, without due process of law; nor shall private property be taken for public use, without just compensation.",
-        },
-        "url": "https://authorityspoke.com/api/v1/us/const/amendment/V/",
-        "end_date": None,
-        "children": [],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/us/const/amendment/",
-    }
-
-
-@pytest.fixture(scope="module")
-def fourteenth_dp():
-    return {
-        "heading": "Citizenship: security and equal protection of citizens.",
-        "start_date": "1868-07-28",
-        "node": "/us/const/amendment/XIV/1",
-        "text_version": {
-            "id": 735717,
-            "url": "https://authorityspoke.com/api/v1/textversions/735717/",
-            "content": "All persons born or naturalized in the United States, and subject to the jurisdiction thereof, are citizens of the United States and of the State wherein they reside. No State shall make or enforce any law which shall abridge the privileges or immunities of citizens of the United States; nor shall any State deprive any person of life, liberty, or property, without due process of law; nor deny to any person within its jurisdiction the equal protection of the laws.",
-        },
-        "url": "https://authorityspoke.com/api/v1/us/const/amendment/XIV/1/",
-        "end_date": None,
-        "children": [],
-        "citations": [],
-        "parent": "https://authorityspoke.com/api/v1/us/const/amendment/XIV/",
+        "parent": f"{API_ROOT}/us/const/amendment/",
     }
 
 
@@ -632,43 +334,26 @@ def provision_with_text_anchor():
     }
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def copyright_clause(test_client):
     return test_client.read_from_json(
-        {
-            "heading": "Patents and copyrights.",
-            "start_date": "1788-09-13",
-            "node": "/us/const/article/I/8/8",
-            "text_version": {
-                "id": 735650,
-                "url": "https://authorityspoke.com/api/v1/textversions/735650/",
-                "content": "To promote the Progress of Science and useful Arts, by securing for limited Times to Authors and Inventors the exclusive Right to their respective Writings and Discoveries;",
-            },
-            "url": "https://authorityspoke.com/api/v1/us/const/article/I/8/8/",
-            "end_date": None,
-            "children": [],
-            "citations": [],
-            "parent": "https://authorityspoke.com/api/v1/us/const/article/I/8/",
-        }
+        _leaf(
+            node="/us/const/article/I/8/8",
+            heading="Patents and copyrights.",
+            start_date="1788-09-13",
+            text_id=735650,
+            content="To promote the Progress of Science and useful Arts, by securing for limited Times to Authors and Inventors the exclusive Right to their respective Writings and Discoveries;",
+        )
     )
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def copyright_statute(test_client):
     return test_client.read_from_json(
-        {
-            "heading": "",
-            "start_date": "2013-07-18",
-            "node": "/us/usc/t17/s102/b",
-            "text_version": {
-                "id": 1030580,
-                "url": "https://authorityspoke.com/api/v1/textversions/1030580/",
-                "content": "In no case does copyright protection for an original work of authorship extend to any idea, procedure, process, system, method of operation, concept, principle, or discovery, regardless of the form in which it is described, explained, illustrated, or embodied in such work.",
-            },
-            "url": "https://authorityspoke.com/api/v1/us/usc/t17/s102/b/",
-            "end_date": None,
-            "children": [],
-            "citations": [],
-            "parent": "https://authorityspoke.com/api/v1/us/usc/t17/s102/",
-        }
+        _leaf(
+            node="/us/usc/t17/s102/b",
+            start_date="2013-07-18",
+            text_id=1030580,
+            content="In no case does copyright protection for an original work of authorship extend to any idea, procedure, process, system, method of operation, concept, principle, or discovery, regardless of the form in which it is described, explained, illustrated, or embodied in such work.",
+        )
     )
@@ -14,27 +14,23 @@ class TestMakeCitation:
 
 
 class TestSerializeCitation:
-    def test_make_citation_object(self, section6d, test_client):
-        section = test_client.read_from_json(section6d)
-        cite = section.as_citation()
-        assert cite.revision_date.isoformat() == "1935-04-01"
+    def test_make_citation_object(self, section6d_citation):
+        assert section6d_citation.revision_date.isoformat() == "1935-04-01"
 
-    def test_constitutional_cite_not_implemented(self, fifth_a, test_client):
-        amendment_5 = test_client.read_from_json(fifth_a)
+    def test_constitutional_cite_not_implemented(self, amendments):
         with pytest.raises(NotImplementedError):
-            amendment_5.as_citation()
-
-    def test_csl_format_citation_type(self, section6d, test_client):
-        section = test_client.read_from_json(section6d)
-        cite = section.as_citation()
-        serialized = cite.csl_dict()
-        assert serialized["type"] == "legislation"
+            amendments["V"].as_citation()
 
-    def test_csl_format_container_title(self, section6d, test_client):
-        section = test_client.read_from_json(section6d)
-        cite = section.as_citation()
-        serialized = cite.csl_dict()
-        assert serialized["container-title"] == "Test Acts"
+    @pytest.mark.parametrize(
+        "field, expected",
+        [
+            pytest.param("type", "legislation", id="citation_type"),
+            pytest.param("container-title", "Test Acts", id="container_title"),
+        ],
+    )
+    def test_csl_format_field(self, section6d_citation, field, expected):
+        serialized = section6d_citation.csl_dict()
+        assert serialized[field] == expected
 
     def test_csl_format_with_revision_date(self, section_11_subdivided, test_client):
         """Citation for provision with a revision date in the database."""
@@ -1,11 +1,10 @@
 import datetime
 from legislice import download
 from legislice.enactments import CitingProvisionLocation, CrossReference
-import os
 
 from anchorpoint import TextQuoteSelector
-from dotenv import load_dotenv
 import pytest
+import requests
 
 from legislice.download import (
     Client,
@@ -15,20 +14,14 @@ from legislice.download import (
 )
 from legislice.enactments import InboundReference
 
-
-load_dotenv()
-
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
 API_ROOT = "https://authorityspoke.com/api/v1"
 
 
 class TestDownloadJSON:
-    client = Client(api_token=TOKEN, api_root=API_ROOT)
-
     @pytest.mark.vcr()
-    def test_fetch_section(self, test_client):
-        url = self.client.url_from_enactment_path("/test/acts/47/1")
-        response = self.client._fetch_from_url(url=url)
+    def test_fetch_section(self, live_client):
+        url = live_client.url_from_enactment_path("/test/acts/47/1")
+        response = live_client._fetch_from_url(url=url)
 
         # Test that there was no redirect from the API
         assert not response.history
@@ -38,18 +31,31 @@ class TestDownloadJSON:
         assert section["end_date"] is None
         assert section["heading"] == "Short title"
 
-    def test_download_from_wrong_domain_raises_error(self, test_client):
-        url = self.client.url_from_enactment_path("/test/acts/47/1")
+    def test_download_from_wrong_domain_raises_error(self, live_client):
+        url = live_client.url_from_enactment_path("/test/acts/47/1")
         wrong_url = url.replace("authorityspoke.com", "pythonforlaw.com")
         with pytest.raises(ValueError):
-            self.client._fetch_from_url(url=wrong_url)
+            live_client._fetch_from_url(url=wrong_url)
+
+    def test_non_json_response_raises_requests_error(self):
+        response = requests.Response()
+        response._content = b"<html></html>"
+        with pytest.raises(requests.JSONDecodeError):
+            download._response_json(response)
+
+    def test_client_with_cache_path_has_own_session(self, live_client, tmp_path):
+        requests_cache = pytest.importorskip("requests_cache")
+        client = Client(cache_path=str(tmp_path / "legislice_cache"))
+        assert isinstance(client._session, requests_cache.CachedSession)
+        assert client._session is not live_client._session
+        client._session.close()
 
     @pytest.mark.vcr()
-    def test_fetch_current_section_with_date(self, test_client):
-        url = self.client.url_from_enactment_path(
+    def test_fetch_current_section_with_date(self, live_client):
+        url = live_client.url_from_enactment_path(
             "/test/acts/47/6D", date=datetime.date(2020, 1, 1)
         )
-        response = self.client._fetch_from_url(url=url)
+        response = live_client._fetch_from_url(url=url)
 
         # Test that there was no redirect from the API
         assert not response.history
@@ -71,8 +77,8 @@ class TestDownloadJSON:
             bad_client.fetch(query="/test/acts/47/1")
 
     @pytest.mark.vcr()
-    def test_extraneous_word_token_before_api_token(self):
-        extraneous_word_token = "Token " + TOKEN
+    def test_extraneous_word_token_before_api_token(self, api_token):
+        extraneous_word_token = "Token " + api_token
         client = Client(api_token=extraneous_word_token, api_root=API_ROOT)
         s102 = client.fetch(query="/test/acts/47/1")
         assert s102["start_date"] == "1935-04-01"
@@ -112,8 +118,46 @@ class TestDownloadJSON:
         assert statute["node"].startswith("/")
 
 
+class TestCacheResponses:
+    @pytest.mark.vcr()
+    def test_repeated_query_is_served_from_cache(self, vcr, tmp_path, api_token):
+        pytest.importorskip("requests_cache")
+        client = Client(
+            api_token=api_token,
+            api_root=API_ROOT,
+            cache_path=str(tmp_path / "legislice_cache"),
+        )
+        first = client.fetch(query="/test/acts/47/1")
+        second = client.fetch(query="/test/acts/47/1")
+        assert second == first
+        assert vcr.play_count == 1
+
+    @pytest.mark.vcr()
+    def test_error_response_is_not_cached(self, vcr, tmp_path):
+        pytest.importorskip("requests_cache")
+        client = Client(api_root=API_ROOT, cache_path=str(tmp_path / "legislice_cache"))
+        for _ in range(2):
+            with pytest.raises(LegislicePathError):
+                client.fetch(query="/us/const/article-III/1")
+        assert vcr.play_count == 2
+
+    @pytest.mark.vcr()
+    def test_cache_is_not_shared_between_api_tokens(self, vcr, tmp_path, api_token):
+        pytest.importorskip("requests_cache")
+        cache_path = str(tmp_path / "legislice_cache")
+        client = Client(api_token=api_token, api_root=API_ROOT, cache_path=cache_path)
+        bad_client = Client(
+            api_token="wr0ngToken", api_root=API_ROOT, cache_path=cache_path
+        )
+        client.fetch(query="/test/acts/47/1")
+        with pytest.raises(LegisliceTokenError):
+            bad_client.fetch(query="/test/acts/47/1")
+        client.fetch(query="/test/acts/47/1")
+        assert vcr.play_count == 2
+
+
 class TestDownloadAndLoad:
-    def test_make_enactment_from_citation(self, test_client, fourth_a):
+    def test_make_enactment_from_citation(self, amendments):
         """
         Test fields for loaded Enactment.
 
@@ -121,7 +165,7 @@ class TestDownloadAndLoad:
         the date that the provision was revised in the USC.
         """
 
-        result = test_client.read_from_json(fourth_a)
+        result = amendments["IV"]
         assert result.text.endswith("persons or things to be seized.")
         assert result.known_revision_date is True
 
@@ -211,7 +255,6 @@ class TestReadJSON:
         cited = test_client.read(ref, date="1950-01-01")
         assert "bona fide religious or cultural reasons." in cited.text
 
-    @pytest.mark.vcr()
     def test_read_enactment_without_version_url(self, test_client):
         data = {
             "start_date": "1935-04-01",
@@ -241,7 +284,7 @@ class TestReadJSON:
         assert result.content.startswith("Where")
 
     @pytest.mark.vcr
-    def test_check_db_coverage_when_reading(self):
+    def test_check_db_coverage_when_reading(self, api_token):
         """
         Test whether default client can check DB coverage.
 
@@ -265,19 +308,14 @@ class TestReadJSON:
             "citations": [],
             "parent": "https://authorityspoke.com/api/v1/us/usc/t17/",
         }
-        client = download.Client(api_token=TOKEN, api_root=API_ROOT)
+        client = download.Client(api_token=api_token, api_root=API_ROOT)
         enactment = client.read_from_json(serialized)
         assert enactment.known_revision_date is False
 
 
 class TestInboundCitations:
-    client = Client(api_token=TOKEN, api_root=API_ROOT)
-
     @pytest.mark.vcr()
-    def test_fetch_inbound_citations_to_node(self, test_client):
-        infringement_statute = test_client.read(
-            query="/us/usc/t17/s501",
-        )
+    def test_fetch_inbound_citations_to_node(self, test_client, infringement_statute):
         inbound_refs = test_client.fetch_citations_to(infringement_statute)
         period_ref = inbound_refs[0]["locations"][0]
         assert period_ref.get("text_version", {}).get("content") is None
@@ -299,10 +337,7 @@ class TestInboundCitations:
         assert str(period_ref).endswith("and 2 other locations")
 
     @pytest.mark.vcr()
-    def test_read_inbound_citations_to_node(self, test_client):
-        infringement_statute = test_client.read(
-            query="/us/usc/t17/s501",
-        )
+    def test_read_inbound_citations_to_node(self, test_client, infringement_statute):
         inbound_refs = test_client.citations_to(infringement_statute)
         assert inbound_refs[0].content.startswith(
             "Any person who distributes a phonorecord"
@@ -316,9 +351,8 @@ class TestInboundCitations:
         assert period_ref.start_date.isoformat() == "2013-07-18"
 
     @pytest.mark.vcr()
-    def test_download_inbound_citations_from_uri(self, test_client):
-        inbound_refs = test_client.citations_to("/us/usc/t17/s501")
-        assert inbound_refs[0].content.startswith(
+    def test_download_inbound_citations_from_uri(self, citations_to_s501):
+        assert citations_to_s501[0].content.startswith(
             "Any person who distributes a phonorecord"
         )
 
@@ -353,14 +387,15 @@ class TestInboundCitations:
         assert enactment.content.startswith("Any person who distributes")
 
     @pytest.mark.vcr()
-    def test_enactment_downloaded_from_citing_location_has_text(self):
-
-        inbound_refs = self.client.citations_to("/us/usc/t17/s501")
+    def test_enactment_downloaded_from_citing_location_has_text(
+        self, live_client, citations_to_s501
+    ):
+        inbound_refs = citations_to_s501
         assert str(inbound_refs[0]).startswith("InboundReference to /us/usc/t17/s501")
         assert inbound_refs[0].content.startswith(
             "Any person who distributes a phonorecord"
         )
-        citing_enactment = self.client.read(inbound_refs[0])
+        citing_enactment = live_client.read(inbound_refs[0])
         assert citing_enactment.node == "/us/usc/t17/s109/b/4"
         assert citing_enactment.text.startswith(
             "Any person who distributes a phonorecord"
@@ -1,14 +1,12 @@
 from datetime import date
-import os
+import operator
 
 from anchorpoint import TextQuoteSelector, TextPositionSelector
 from anchorpoint.textselectors import TextPositionSet, TextSelectionError, Range
-from dotenv import load_dotenv
 from pydantic import ValidationError
 import pytest
 
 from legislice.citations import CodeLevel
-from legislice.download import Client
 from legislice.enactments import (
     CitingProvisionLocation,
     Enactment,
@@ -18,17 +16,46 @@ from legislice.enactments import (
     consolidate_enactments,
 )
 
-load_dotenv()
+# Test Acts provisions first took effect in 1935 and were partly revised in 2013
+ENACTED_1935 = date(1935, 4, 1)
+REVISED_2013 = date(2013, 7, 18)
+BEFORE_REVISION = date(1999, 1, 1)
+AFTER_REVISION = date(2020, 1, 1)
+
+# Start dates of U.S. Constitution provisions
+ADOPTED_1788 = date(1788, 9, 13)
+ADOPTED_1791 = date(1791, 12, 15)
+ADOPTED_1868 = date(1868, 7, 28)
+
+# Three phrases from /test/acts/47/11, as quotes and as the positions they match
+LICENSE_QUOTES = (
+    TextQuoteSelector(exact="The Department of Beards may issue licenses to such"),
+    TextQuoteSelector(exact="hairdressers", suffix=", or other male grooming"),
+    TextQuoteSelector(exact="as they see fit"),
+)
+LICENSE_POSITIONS = TextPositionSet(
+    positions=[
+        TextPositionSelector(start=0, end=51),
+        TextPositionSelector(start=61, end=73),
+        TextPositionSelector(start=112, end=127),
+    ],
+)
 
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
-API_ROOT = "https://authorityspoke.com/api/v1"
+# The part of the Fourth Amendment before "and no Warrants"
+NO_WARRANTS_PREFIX = TextQuoteSelector(suffix=", and no Warrants")
+DEPARTMENT_OF_BEARDS = TextQuoteSelector(
+    prefix="officer of the ", exact="Department of Beards"
+)
+DUE_PROCESS = TextQuoteSelector(
+    exact="life, liberty, or property, without due process of law"
+)
 
 
 class TestMakeEnactment:
     def test_init_enactment_without_nesting(self):
         s1 = Enactment(
             node="/test/acts/47/1",
-            start_date=date(1935, 4, 1),
+            start_date=ENACTED_1935,
             heading="Short title",
             content=(
                 "This Act may be cited as the Australian Beard Tax"
@@ -44,7 +71,7 @@ class TestMakeEnactment:
             heading="",
             text_version="The beardcoin shall be a cryptocurrency token…",
             node="/test/acts/47/6C/1",
-            start_date=date(2013, 7, 18),
+            start_date=REVISED_2013,
         )
 
         section = Enactment(
@@ -53,7 +80,7 @@ class TestMakeEnactment:
             node="/test/acts/47/6C",
             children=[subsection],
             end_date=None,
-            start_date=date(1935, 4, 1),
+            start_date=ENACTED_1935,
         )
 
         assert section.children[0].content.startswith("The beardcoin shall")
@@ -123,21 +150,20 @@ class TestEnactmentDetails:
         assert enactment.sovereign == "us"
         assert enactment.level == CodeLevel.STATUTE
 
-    @pytest.mark.vcr
-    def test_str_representation(self, fourth_a, test_client):
-        enactment = test_client.read_from_json(fourth_a)
+    def test_str_representation(self, amendments):
+        enactment = amendments["IV"]
         selection = TextQuoteSelector(
             exact="The right of the people to be secure in their persons"
         )
         new = enactment.select(selection)
         assert new.level == CodeLevel.CONSTITUTION
-        assert new.start_date == date(1791, 12, 15)
+        assert new.start_date == ADOPTED_1791
         assert "secure in their persons…" in str(new)
         assert enactment.node in str(new)
         assert "1791-12-15" in str(new)
 
-    def test_node_parts(self, section_11_subdivided):
-        enactment = Enactment(**section_11_subdivided)
+    def test_node_parts(self, section_11_subdivided_enactment):
+        enactment = section_11_subdivided_enactment
         passage = enactment.select_all()
         assert passage.section == "11"
         assert passage.title == "47"
@@ -157,12 +183,12 @@ class TestEnactmentDetails:
         assert enactment.jurisdiction == "us"
 
     @pytest.mark.vcr
-    def test_constitution_effective_date(self, test_client):
-        ex_post_facto_provision = test_client.read(query="/us/const/article/I/8/8")
-        assert ex_post_facto_provision.start_date == date(1788, 9, 13)
+    def test_constitution_effective_date(self, read):
+        ex_post_facto_provision = read("/us/const/article/I/8/8")
+        assert ex_post_facto_provision.start_date == ADOPTED_1788
 
     @pytest.mark.vcr
-    def test_date_and_text_from_path_and_regime(self, test_client):
+    def test_date_and_text_from_path_and_regime(self, read):
         """
         This tests different parsing code because the date is
         in the format "dated the 25th of September, 1804"
@@ -172,14 +198,14 @@ class TestEnactmentDetails:
         ``exact``, ``prefix``, or ``suffix`` parameter was
         passed to the TextQuoteSelector constructor.
         """
-        amendment_5 = test_client.read(query="/us/const/amendment/V")
-        assert amendment_5.start_date == date(1791, 12, 15)
+        amendment_5 = read("/us/const/amendment/V")
+        assert amendment_5.start_date == ADOPTED_1791
         assert "otherwise infamous crime" in amendment_5.text
 
-    def test_compare_effective_dates(self, fifth_a, fourteenth_dp, test_client):
-        amendment_5 = test_client.read_from_json(fifth_a)
-        amendment_14 = test_client.read_from_json(fourteenth_dp)
-        assert amendment_14.start_date == date(1868, 7, 28)
+    def test_compare_effective_dates(self, amendments):
+        amendment_5 = amendments["V"]
+        amendment_14 = amendments["XIV/1"]
+        assert amendment_14.start_date == ADOPTED_1868
         assert amendment_5.start_date < amendment_14.start_date
 
     @pytest.mark.skip(reason="No regulations available via API.")
@@ -207,14 +233,14 @@ class TestEnactmentDetails:
 
 class TestCrossReferences:
     @pytest.mark.vcr()
-    def test_no_local_cross_references(self, test_client):
-        enactment = test_client.read("/test/acts/47/6D")
+    def test_no_local_cross_references(self, read):
+        enactment = read("/test/acts/47/6D")
         citations = enactment.citations
         assert len(citations) == 0
 
     @pytest.mark.vcr()
-    def test_collect_nested_cross_references(self, test_client):
-        enactment = test_client.read("/test/acts/47/6D")
+    def test_collect_nested_cross_references(self, read):
+        enactment = read("/test/acts/47/6D")
         citations = enactment.cross_references()
         assert len(citations) == 1
         assert citations[0].target_uri == "/test/acts/47/6C"
@@ -224,8 +250,8 @@ class TestCrossReferences:
         )
 
     @pytest.mark.vcr()
-    def test_locations_of_cross_reference(self, test_client):
-        enactment = test_client.read("/test/acts/47/6D")
+    def test_locations_of_cross_reference(self, test_client, read):
+        enactment = read("/test/acts/47/6D")
         assert "Section 6C" in enactment.text
         references = enactment.cross_references()
         citations = test_client.citations_to(references[0])
@@ -233,8 +259,6 @@ class TestCrossReferences:
 
 
 class TestSelectText:
-    client = Client(api_token=TOKEN)
-
     def test_same_quotation_from_enactments_of_differing_depths(
         self, test_client, section_11_subdivided
     ):
@@ -256,7 +280,7 @@ class TestSelectText:
             heading="",
             text_version="The beardcoin shall be a cryptocurrency token…",
             node="/test/acts/47/6C/1",
-            start_date=date(2013, 7, 18),
+            start_date=REVISED_2013,
         )
 
         section = Enactment(
@@ -265,7 +289,7 @@ class TestSelectText:
             node="/test/acts/47/6C",
             children=[subsection],
             end_date=None,
-            start_date=date(1935, 4, 1),
+            start_date=ENACTED_1935,
         )
         selection = section.select(section.content)
         assert selection.selected_text() == "Where an exemption is granted…"
@@ -280,7 +304,7 @@ class TestSelectText:
             node="/test/acts/47/6C",
             children=[],
             end_date=None,
-            start_date=date(1935, 4, 1),
+            start_date=ENACTED_1935,
         )
         selection = section.select(section.text_version.content)
         assert selection.text_sequence()[0].text == "Where an exemption is granted…"
@@ -302,14 +326,7 @@ class TestSelectText:
 
     def test_str_for_text_sequence(self, test_client, section_11_subdivided):
         section = test_client.read_from_json(section_11_subdivided)
-        quotes = [
-            TextQuoteSelector(
-                exact="The Department of Beards may issue licenses to such"
-            ),
-            TextQuoteSelector(exact="hairdressers", suffix=", or other male grooming"),
-            TextQuoteSelector(exact="as they see fit"),
-        ]
-        selection = section.select(quotes)
+        selection = section.select(list(LICENSE_QUOTES))
         text_sequence = selection.text_sequence()
         assert str(text_sequence) == (
             "The Department of Beards may issue "
@@ -321,20 +338,17 @@ class TestSelectText:
         assert "or remove the beard with" in section.text
         assert "or  remove the beard with" not in section.text
 
-    def test_select_space_between_selected_passages(self, fourteenth_dp, test_client):
+    def test_select_space_between_selected_passages(self, amendments):
         """Test that the space between "property," and "without" is selected."""
-        section_1 = test_client.read_from_json(fourteenth_dp)
-        selection = section_1.select("without due process of law")
+        selection = amendments["XIV/1"].select("without due process of law")
         selection.select_more("life, liberty, or property,")
         now_selected = selection.selected_text()
         assert "or property, without" in now_selected
 
 
 class TestSelectFromEnactment:
-    client = Client(api_token=TOKEN)
-
-    def test_text_of_enactment_subset(self, section_11_together):
-        combined = Enactment(**section_11_together)
+    def test_text_of_enactment_subset(self, section_11_together_enactment):
+        combined = section_11_together_enactment
         selector = TextQuoteSelector(
             exact="barbers, hairdressers, or other male grooming professionals"
         )
@@ -342,23 +356,23 @@ class TestSelectFromEnactment:
         sequence = passage.text_sequence()
         assert str(sequence).strip("…").startswith("barbers")
 
-    def test_get_passage(self, section_11_subdivided):
+    def test_get_passage(self, section_11_subdivided_enactment):
         """
         Use selector to get passage from Enactment without changing which part is selected.
 
         Checks that `.selected_text()` is the same before and after `.get_passage()`.
         """
-        section = Enactment(**section_11_subdivided)
+        section = section_11_subdivided_enactment
         passage = section.select(TextPositionSelector(start=61, end=73))
         assert passage.selected_text() == "…hairdressers…"
         fit_passage = section.get_string(TextPositionSelector(start=112, end=127))
         assert fit_passage == "…as they see fit…"
 
-    def test_get_child_passage(self, section_11_subdivided):
+    def test_get_child_passage(self, section_11_subdivided_enactment):
         """
         Use selector to get passage from child of Enactment.
         """
-        section = Enactment(**section_11_subdivided)
+        section = section_11_subdivided_enactment
         passage = section.select(
             [
                 TextQuoteSelector(
@@ -379,28 +393,20 @@ class TestSelectFromEnactment:
         assert child_passage.selection.ranges()[0] == Range(start=20, end=33)
         assert child_passage.node == "/test/acts/47/11/iii"
 
-    def test_select_nested_text_with_positions(self, section_11_subdivided):
-        phrases = TextPositionSet(
-            positions=[
-                TextPositionSelector(start=0, end=51),
-                TextPositionSelector(start=61, end=73),
-                TextPositionSelector(start=112, end=127),
-            ],
-        )
-        section = Enactment(**section_11_subdivided)
-        passage = section.select(phrases)
+    def test_select_nested_text_with_positions(self, section_11_subdivided_enactment):
+        section = section_11_subdivided_enactment
+        passage = section.select(LICENSE_POSITIONS)
         text_sequence = passage.text_sequence()
         assert str(text_sequence) == (
             "The Department of Beards may issue licenses to "
             "such…hairdressers…as they see fit…"
         )
 
-    def test_selection_in_middle_of_enactment(self, test_client, fourth_a):
-        result = test_client.read_from_json(fourth_a)
+    def test_selection_in_middle_of_enactment(self, amendments):
         selector = TextQuoteSelector(
             prefix="and", exact="the persons or things", suffix="to be seized."
         )
-        passage = result.select(selector)
+        passage = amendments["IV"].select(selector)
         assert passage.selected_text().endswith("or things…")
 
     def test_select_all_of_empty_enactment(self):
@@ -408,24 +414,24 @@ class TestSelectFromEnactment:
             node="/us/usc/t1/s101",
             heading="No text",
             text_version="",
-            start_date=date(1935, 4, 1),
+            start_date=ENACTED_1935,
         )
         passage = empty.select_all()
         assert passage.selected_text() == ""
 
-    def test_select_none(self, section_11_subdivided):
-        combined = Enactment(**section_11_subdivided)
+    def test_select_none(self, section_11_subdivided_enactment):
+        combined = section_11_subdivided_enactment
         passage = combined.select(False)
         assert passage.selected_text() == ""
 
-    def test_select_none_with_None(self, section_11_subdivided):
-        combined = Enactment(**section_11_subdivided)
+    def test_select_none_with_None(self, section_11_subdivided_enactment):
+        combined = section_11_subdivided_enactment
         passage = combined.select(None)
         assert passage.selected_text() == ""
 
-    def test_select_all(self, section_11_subdivided):
+    def test_select_all(self, section_11_subdivided_enactment):
         """Clear selected text, and then select one subsection."""
-        combined = Enactment(**section_11_subdivided)
+        combined = section_11_subdivided_enactment
         passage = combined.select(None)
         assert passage.enactment.node == "/test/acts/47/11"
         sub_passage = passage.enactment.children[3].select_all()
@@ -435,14 +441,14 @@ class TestSelectFromEnactment:
         )
         assert sub_passage.enactment.node == "/test/acts/47/11/iii-con"
 
-    def test_select_all_nested(self, section_11_subdivided):
+    def test_select_all_nested(self, section_11_subdivided_enactment):
         """Clear selected text, and then select one subsection."""
-        section = Enactment(**section_11_subdivided)
+        section = section_11_subdivided_enactment
         passage = section.select()
         assert passage.selected_text().startswith("The Department of Beards")
 
-    def test_error_for_unusable_selector(self, section_11_subdivided):
-        section = Enactment(**section_11_subdivided)
+    def test_error_for_unusable_selector(self, section_11_subdivided_enactment):
+        section = section_11_subdivided_enactment
         selection = TextPositionSet(
             positions=[
                 TextPositionSelector(start=0, end=10),
@@ -452,29 +458,15 @@ class TestSelectFromEnactment:
         with pytest.raises(ValueError):
             section.children[3].select(selection)
 
-    @pytest.mark.vcr
-    def test_get_positions_from_quotes(self, section_11_subdivided):
-        section = Enactment(**section_11_subdivided)
-        quotes = [
-            TextQuoteSelector(
-                exact="The Department of Beards may issue licenses to such"
-            ),
-            TextQuoteSelector(exact="hairdressers", suffix=", or other male grooming"),
-            TextQuoteSelector(exact="as they see fit"),
-        ]
-        positions = section.convert_quotes_to_position(quotes)
-        assert positions == TextPositionSet(
-            positions=[
-                TextPositionSelector(start=0, end=51),
-                TextPositionSelector(start=61, end=73),
-                TextPositionSelector(start=112, end=127),
-            ],
-        )
+    def test_get_positions_from_quotes(self, section_11_subdivided_enactment):
+        section = section_11_subdivided_enactment
+        positions = section.convert_quotes_to_position(list(LICENSE_QUOTES))
+        assert positions == LICENSE_POSITIONS
 
     @pytest.mark.vcr
-    def test_text_sequence_has_no_consecutive_Nones(self, test_client):
+    def test_text_sequence_has_no_consecutive_Nones(self, read):
 
-        amend_14 = test_client.read(query="/us/const/amendment/XIV")
+        amend_14 = read("/us/const/amendment/XIV")
         selector = TextQuoteSelector(exact="life, liberty, or property")
         passage = amend_14.select(selector)
         selected_list = passage.text_sequence()
@@ -484,20 +476,20 @@ class TestSelectFromEnactment:
         assert selected_list[1].text == "life, liberty, or property"
         assert selected_list[2] is None
 
-    def test_select_with_position_selector(self, section_11_together):
-        section = Enactment(**section_11_together)
+    def test_select_with_position_selector(self, section_11_together_enactment):
+        section = section_11_together_enactment
         passage = section.select(TextPositionSelector(start=29, end=43))
         assert passage.selected_text() == "…issue licenses…"
 
-    def test_invalid_selector_text(self, section_11_subdivided):
+    def test_invalid_selector_text(self, section_11_subdivided_enactment):
         selector = TextQuoteSelector(exact="text that doesn't exist in the code")
-        enactment = Enactment(**section_11_subdivided)
+        enactment = section_11_subdivided_enactment
 
         with pytest.raises(TextSelectionError):
             enactment.select(selector)
 
-    def test_select_text_with_string(self, fourth_a):
-        section = Enactment(**fourth_a)
+    def test_select_text_with_string(self, amendments):
+        section = amendments["IV"]
         passage = section.select("The right of the people")
         assert passage.selected_text() == "The right of the people…"
 
@@ -512,14 +504,14 @@ class TestSelectFromEnactment:
         )
 
     @pytest.mark.vcr
-    def test_no_space_before_ellipsis(self, test_client):
-        enactment = test_client.read(query="/us/usc/t17/s102/b")
+    def test_no_space_before_ellipsis(self, read):
+        enactment = read("/us/usc/t17/s102/b")
         passage = enactment.select(TextQuoteSelector(suffix="idea, procedure,"))
         assert " …" not in passage.selected_text()
 
     @pytest.mark.vcr
-    def test_select_near_end_of_section(self):
-        amendment = self.client.read(query="/us/const/amendment/XIV")
+    def test_select_near_end_of_section(self, live_client):
+        amendment = live_client.read(query="/us/const/amendment/XIV")
         selector = TextPositionSelector(start=1920, end=1980)
         passage = amendment.select(selector)
         assert "The validity of the public debt" in passage.selected_text()
@@ -539,15 +531,14 @@ class TestCompareEnactment:
     @pytest.mark.vcr
     def test_equal_enactment_text(self, test_client):
         """Test provisions with the same text (different dates)."""
-        old_version = test_client.read(query="/test/acts/47/6A", date=date(1999, 1, 1))
-        new_version = test_client.read(query="/test/acts/47/6A", date=date(2020, 1, 1))
+        old_version = test_client.read(query="/test/acts/47/6A", date=BEFORE_REVISION)
+        new_version = test_client.read(query="/test/acts/47/6A", date=AFTER_REVISION)
         assert old_version.means(new_version)
 
-    @pytest.mark.vcr
-    def test_unequal_enactment_text(self, fourth_a):
+    def test_unequal_enactment_text(self, amendments):
 
-        enactment = Enactment(**fourth_a)
-        selector = TextQuoteSelector(suffix=", and no Warrants")
+        enactment = amendments["IV"]
+        selector = NO_WARRANTS_PREFIX
         search_clause = enactment.select(selector)
 
         whole_provision = enactment.select_all()
@@ -575,13 +566,12 @@ class TestCompareEnactment:
     def test_not_gt_if_equal_with_selection(self, test_client):
 
         search_clause = test_client.read(query="/us/const/amendment/IV")
-        search_clause.select(TextQuoteSelector(suffix=", and no Warrants"))
+        search_clause.select(NO_WARRANTS_PREFIX)
 
         assert search_clause == search_clause
         assert search_clause.means(search_clause)
         assert not search_clause > search_clause
 
-    @pytest.mark.vcr
     def test_different_section_same_text(self, test_client, old_section_8, section_8):
 
         old_version = test_client.read_from_json(
@@ -592,24 +582,23 @@ class TestCompareEnactment:
         )
         assert old_version.means(new_version)
 
-    @pytest.mark.vcr
     def test_combined_section_implies_subdivided_section(
-        self, section_11_together, section_11_subdivided
+        self, section_11_together_enactment, section_11_subdivided_enactment
     ):
-        combined = Enactment(**section_11_together)
+        combined = section_11_together_enactment
         passage = combined.select_all()
-        subdivided = Enactment(**section_11_subdivided)
+        subdivided = section_11_subdivided_enactment
         divided_passage = subdivided.select_all()
         assert passage >= divided_passage
         assert not passage > divided_passage
         assert passage.text_sequence() >= divided_passage.text_sequence()
 
     def test_passage_does_not_imply_text_sequence(
-        self, section_11_together, section_11_subdivided
+        self, section_11_together_enactment, section_11_subdivided_enactment
     ):
-        combined = Enactment(**section_11_together)
+        combined = section_11_together_enactment
         passage = combined.select_all()
-        subdivided = Enactment(**section_11_subdivided)
+        subdivided = section_11_subdivided_enactment
         divided_passage = subdivided.select_all()
         with pytest.raises(TypeError):
             passage >= divided_passage.text_sequence()
@@ -617,7 +606,7 @@ class TestCompareEnactment:
     @pytest.mark.vcr
     def test_more_provisions_implies_fewer(self, test_client, section_8):
         fewer_provisions = test_client.read(
-            query="/test/acts/47/8/2", date=date(1999, 1, 1)
+            query="/test/acts/47/8/2", date=BEFORE_REVISION
         )
         more_provisions = test_client.read_from_json(section_8["children"][1])
         assert more_provisions >= fewer_provisions
@@ -625,9 +614,8 @@ class TestCompareEnactment:
         assert not fewer_provisions >= more_provisions
         assert not fewer_provisions > more_provisions
 
-    @pytest.mark.vcr
-    def test_enactment_subset(self, section_11_together):
-        combined = Enactment(**section_11_together)
+    def test_enactment_subset(self, section_11_together_enactment):
+        combined = section_11_together_enactment
         passage = combined.select_all()
         selector = TextQuoteSelector(
             exact="barbers, hairdressers, or other male grooming professionals"
@@ -643,67 +631,59 @@ class TestCompareEnactment:
             passage.means(enactment.text_version)
 
     @pytest.mark.vcr
-    def test_same_phrase_different_provisions_same_meaning(self, test_client):
-
-        amend_5 = test_client.read(query="/us/const/amendment/V")
-        amend_14 = test_client.read(query="/us/const/amendment/XIV/1")
-        selector = TextQuoteSelector(
-            exact="life, liberty, or property, without due process of law"
-        )
-        left = amend_5.select(selector)
-        right = amend_14.select(selector)
-        assert left.means(right)
-
-    @pytest.mark.vcr
-    def test_same_phrase_different_provisions_implication(self, test_client):
-        amend_5 = test_client.read(query="/us/const/amendment/V")
-        amend_14 = test_client.read(query="/us/const/amendment/XIV/1")
-        selector = TextQuoteSelector(
-            exact="life, liberty, or property, without due process of law"
-        )
-        left = amend_5.select(selector)
-        right = amend_14.select(selector)
-        assert left >= right
-
-    @pytest.mark.vcr
-    def test_same_phrase_selected_in_nested_provision_same_meaning(self, test_client):
-
-        amend_5 = test_client.read(query="/us/const/amendment/V")
-        amend_14 = test_client.read(query="/us/const/amendment/XIV")
-        selector = TextQuoteSelector(
-            exact="life, liberty, or property, without due process of law"
-        )
-        left = amend_5.select(selector)
-        right = amend_14.select(selector)
-        assert left.means(right)
-
-    @pytest.mark.vcr
-    def test_same_phrase_selected_in_nested_provision_implication(self, test_client):
-
-        amend_5 = test_client.read(query="/us/const/amendment/V")
-        amend_14 = test_client.read(query="/us/const/amendment/XIV")
-        selector = TextQuoteSelector(
-            exact="life, liberty, or property, without due process of law"
-        )
-        left = amend_5.select(selector)
-        right = amend_14.select(selector)
-        assert left >= right
-
-    def test_fail_to_check_enactment_implies_textsequence(self, section_11_subdivided):
-        subdivided = Enactment(**section_11_subdivided)
+    @pytest.mark.parametrize(
+        "path, compare",
+        [
+            pytest.param(
+                "/us/const/amendment/XIV/1",
+                EnactmentPassage.means,
+                id="different_provisions_same_meaning",
+            ),
+            pytest.param(
+                "/us/const/amendment/XIV/1",
+                operator.ge,
+                id="different_provisions_implication",
+            ),
+            pytest.param(
+                "/us/const/amendment/XIV",
+                EnactmentPassage.means,
+                id="selected_in_nested_provision_same_meaning",
+            ),
+            pytest.param(
+                "/us/const/amendment/XIV",
+                operator.ge,
+                id="selected_in_nested_provision_implication",
+            ),
+        ],
+    )
+    def test_same_phrase(self, read, path, compare):
+        amend_5 = read("/us/const/amendment/V")
+        amend_14 = read(path)
+        left = amend_5.select(DUE_PROCESS)
+        right = amend_14.select(DUE_PROCESS)
+        assert compare(left, right)
+
+    def test_fail_to_check_enactment_implies_textsequence(
+        self, section_11_subdivided_enactment
+    ):
+        subdivided = section_11_subdivided_enactment
         text = subdivided.text_sequence()
         with pytest.raises(TypeError):
             _ = subdivided >= text
 
-    def test_fail_to_check_if_enactment_means_textpassage(self, section_11_subdivided):
-        subdivided = Enactment(**section_11_subdivided)
+    def test_fail_to_check_if_enactment_means_textpassage(
+        self, section_11_subdivided_enactment
+    ):
+        subdivided = section_11_subdivided_enactment
         subdivided.select_all()
         text = subdivided.text_sequence()
         with pytest.raises(TypeError):
             _ = subdivided.means(text.passages[0])
 
-    def test_fail_to_check_if_textpassage_means_enactment(self, section_11_subdivided):
-        subdivided = Enactment(**section_11_subdivided)
+    def test_fail_to_check_if_textpassage_means_enactment(
+        self, section_11_subdivided_enactment
+    ):
+        subdivided = section_11_subdivided_enactment
         subdivided.select_all()
         text = subdivided.text_sequence()
         with pytest.raises(TypeError):
@@ -725,7 +705,6 @@ class TestAddEnactments:
 
         assert combined.means(greater_passage)
 
-    @pytest.mark.vcr
     def test_add_superset_nested_enactment(self, section_8, test_client):
         """Test that adding an included Enactment returns the same Enactment."""
         greater = test_client.read_from_json(section_8["children"][1])
@@ -737,7 +716,6 @@ class TestAddEnactments:
 
         assert combined.means(greater_passage)
 
-    @pytest.mark.vcr
     def test_add_enactment_to_passage(self, section_8, test_client):
         """Test that adding an included Enactment returns the same Enactment."""
         greater = test_client.read_from_json(section_8["children"][1])
@@ -752,11 +730,10 @@ class TestAddEnactments:
         assert "Any such person" in selected_text
         assert "must…shave" in selected_text
 
-    def test_add_shorter_plus_longer(self, fourth_a):
-        fourth_a = Enactment(**fourth_a)
-        selector = TextQuoteSelector(suffix=", and no Warrants")
-        amendment = fourth_a.select_all()
-        search_clause = fourth_a.select(selector)
+    def test_add_shorter_plus_longer(self, amendments):
+        selector = NO_WARRANTS_PREFIX
+        amendment = amendments["IV"].select_all()
+        search_clause = amendments["IV"].select(selector)
 
         greater_plus_lesser = amendment + search_clause
 
@@ -767,9 +744,9 @@ class TestAddEnactments:
         assert lesser_plus_greater.text == amendment.text
         assert lesser_plus_greater.means(amendment)
 
-    def test_add_overlapping_text_selection(self, fourth_a):
-        enactment = Enactment(**fourth_a)
-        passage = enactment.select(TextQuoteSelector(suffix=", and no Warrants"))
+    def test_add_overlapping_text_selection(self, amendments):
+        enactment = amendments["IV"]
+        passage = enactment.select(NO_WARRANTS_PREFIX)
         new = enactment.make_selection(
             TextQuoteSelector(
                 exact="shall not be violated, and no Warrants shall issue,"
@@ -784,8 +761,8 @@ class TestAddEnactments:
         )
         assert expected in passage.selected_text()
 
-    def test_non_overlapping_text_selection(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_non_overlapping_text_selection(self, amendments):
+        enactment = amendments["IV"]
         left = enactment.select("The right of the people to be secure in their persons")
         right = enactment.select("shall not be violated")
         left.select_more_text_at_current_node(right.selection)
@@ -794,8 +771,8 @@ class TestAddEnactments:
             "shall not be violated…"
         )
 
-    def test_limit_selected_text(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_limit_selected_text(self, amendments):
+        enactment = amendments["IV"]
         passage = enactment.select(
             "The right of the people to be secure in their persons"
         )
@@ -807,15 +784,15 @@ class TestAddEnactments:
         passage.limit_selection(start=40)
         assert passage.selected_text() == "…their persons…shall not be violated…"
 
-    def test_change_selection_to_all(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_change_selection_to_all(self, amendments):
+        enactment = amendments["IV"]
         passage = enactment.select("right of the people")
         assert passage.selected_text() == ("…right of the people…")
         passage.select_all()
         assert passage.selected_text().startswith("The right of the people to")
 
-    def test_select_unavailable_text(self, fourth_a):
-        fourth = Enactment(**fourth_a)
+    def test_select_unavailable_text(self, amendments):
+        fourth = amendments["IV"]
         with pytest.raises(TextSelectionError):
             fourth.select("right to privacy")
 
@@ -843,9 +820,9 @@ class TestAddEnactments:
         # Test that original Enactments unchanged
         assert "obtain a beardcoin" not in new_selection.selected_text()
 
-    def test_add_overlapping_enactments(self, fourth_a):
-        enactment = Enactment(**fourth_a)
-        search = enactment.select(TextQuoteSelector(suffix=", and no Warrants"))
+    def test_add_overlapping_enactments(self, amendments):
+        enactment = amendments["IV"]
+        search = enactment.select(NO_WARRANTS_PREFIX)
         warrant = enactment.select(
             TextQuoteSelector(
                 exact="shall not be violated, and no Warrants shall issue,"
@@ -940,9 +917,7 @@ class TestAddEnactments:
         )
 
         old_version = test_client.read_from_json(old_section_8)
-        old_passage = old_version.select(
-            TextQuoteSelector(prefix="officer of the ", exact="Department of Beards")
-        )
+        old_passage = old_version.select(DEPARTMENT_OF_BEARDS)
 
         with pytest.raises(TextSelectionError):
             new_passage + old_passage
@@ -1001,9 +976,7 @@ class TestAddEnactments:
             )
         )
 
-        old_version.select(
-            TextQuoteSelector(prefix="officer of the ", exact="Department of Beards")
-        )
+        old_version.select(DEPARTMENT_OF_BEARDS)
 
         combined = new_version + old_version
         assert combined.text == "…Department of Beards…Australian Federal Police…"
@@ -1018,26 +991,24 @@ class TestAddEnactments:
         result = old_version.rangedict()
         memo = result[3]
         assert memo.content.startswith("Where an officer")
-        assert memo.start_date == date(1935, 4, 1)
+        assert memo.start_date == ENACTED_1935
 
     def test_passage_start_date_is_latest_amendment(self, section_8, test_client):
         new_version = test_client.read_from_json(section_8)
         new_passage = new_version.select("remove the beard with electrolysis")
-        assert new_passage.start_date == date(2013, 7, 18)
+        assert new_passage.start_date == REVISED_2013
         assert new_passage.end_date is None
 
     def test_repealed_passage_end_date_is_earliest_found(
         self, old_section_8, test_client
     ):
         old_version = test_client.read_from_json(old_section_8)
-        old_passage = old_version.select(
-            TextQuoteSelector(prefix="officer of the ", exact="Department of Beards")
-        )
+        old_passage = old_version.select(DEPARTMENT_OF_BEARDS)
         old_passage.select_more("obtain a beardcoin from the Department of Beards")
         # adding an earlier end date
         old_passage.enactment.children[1].children[2].end_date = date(2001, 1, 1)
         old_passage.select_more("within 14 days of such notice")
-        assert old_passage.start_date == date(1935, 4, 1)
+        assert old_passage.start_date == ENACTED_1935
         assert old_passage.end_date == date(2001, 1, 1)
 
     def test_unable_to_add_subsection_with_new_text(
@@ -1045,15 +1016,13 @@ class TestAddEnactments:
     ):
         old_version = test_client.read_from_json(old_section_8)
         new_version = test_client.read_from_json(section_8)
-        old_passage = old_version.select(
-            TextQuoteSelector(prefix="officer of the ", exact="Department of Beards")
-        )
+        old_passage = old_version.select(DEPARTMENT_OF_BEARDS)
         new_passage = new_version.select("remove the beard with electrolysis")
         with pytest.raises(TextSelectionError):
             old_passage + new_passage
 
-    def test_add_string_as_selector(self, section_11_subdivided):
-        section = Enactment(**section_11_subdivided)
+    def test_add_string_as_selector(self, section_11_subdivided_enactment):
+        section = section_11_subdivided_enactment
         passage = section.select("The Department of Beards may issue licenses to such")
         more = passage + "hairdressers"
         assert (
@@ -1073,8 +1042,8 @@ class TestAddEnactments:
         passage.select("Australian Defence Force")
         assert passage.selected_text() == "…Australian Defence Force…"
 
-    def test_cannot_select_text_with_citation(self, section_11_subdivided):
-        section = Enactment(**section_11_subdivided)
+    def test_cannot_select_text_with_citation(self, section_11_subdivided_enactment):
+        section = section_11_subdivided_enactment
         cite = section.as_citation()
         with pytest.raises(ValidationError):
             section.select(cite)
@@ -1083,9 +1052,9 @@ class TestAddEnactments:
 class TestConsolidateEnactments:
     """Test function for combining a list of Enactments."""
 
-    def test_consolidate_enactments(self, fourth_a):
-        enactment = Enactment(**fourth_a)
-        search_selector = TextQuoteSelector(suffix=", and no Warrants")
+    def test_consolidate_enactments(self, amendments):
+        enactment = amendments["IV"]
+        search_selector = NO_WARRANTS_PREFIX
         search_clause = enactment.select(search_selector)
 
         warrants_selector = TextQuoteSelector(prefix="shall not be violated,")
@@ -1100,9 +1069,9 @@ class TestConsolidateEnactments:
         assert consolidated[0].means(fourth_amendment)
 
     @pytest.mark.vcr()
-    def test_consolidate_adjacent_passages(self, test_client):
-        copyright_clause = test_client.read("/us/const/article/I/8/8")
-        copyright_statute = test_client.read("/us/usc/t17/s102/b").select_all()
+    def test_consolidate_adjacent_passages(self, read):
+        copyright_clause = read("/us/const/article/I/8/8")
+        copyright_statute = read("/us/usc/t17/s102/b").select_all()
 
         selection = copyright_clause.select(None)
         securing_for_authors = selection + (
@@ -1127,10 +1096,10 @@ class TestConsolidateEnactments:
             for law in combined
         )
 
-    def test_do_not_consolidate_from_different_sections(self, fifth_a, fourteenth_dp):
+    def test_do_not_consolidate_from_different_sections(self, amendments):
 
-        due_process_5 = Enactment(**fifth_a)
-        due_process_14 = Enactment(**fourteenth_dp)
+        due_process_5 = amendments["V"]
+        due_process_14 = amendments["XIV/1"]
 
         passage = "life, liberty, or property, without due process of law"
         quote_5 = due_process_5.select(passage)
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from datetime import date
 
 from pydantic import ValidationError
@@ -35,17 +34,14 @@ class TestEnactmentGroups:
             for law in combined
         )
 
-    def test_wrong_type_in_group(self, section6d, test_client):
-        section = test_client.read_from_json(section6d)
-        cite = section.as_citation()
+    def test_wrong_type_in_group(self, section6d_citation):
         with pytest.raises(ValidationError):
-            EnactmentGroup(passages=[cite])
+            EnactmentGroup(passages=[section6d_citation])
 
 
 class TestImplies:
     def test_no_implication_of_group(self, copyright_clause, copyright_statute):
-        extra = deepcopy(copyright_clause)
-        passage = extra.select(None)
+        passage = copyright_clause.select(None)
         securing_for_authors = passage + (
             "To promote the Progress of Science and "
             "useful Arts, by securing for limited Times to Authors"
@@ -58,8 +54,7 @@ class TestImplies:
         assert not left.implies(right)
 
     def test_implication_of_group(self, copyright_clause, copyright_statute):
-        extra = deepcopy(copyright_clause)
-        passage = extra.select(None)
+        passage = copyright_clause.select(None)
         securing_for_authors = passage + (
             "To promote the Progress of Science and "
             "useful Arts, by securing for limited Times to Authors"
@@ -71,8 +66,7 @@ class TestImplies:
         assert left >= right
 
     def test_implication_of_enactment(self, copyright_clause, copyright_statute):
-        extra = deepcopy(copyright_clause)
-        passage = extra.select(None)
+        passage = copyright_clause.select(None)
         securing_for_authors = passage + (
             "To promote the Progress of Science and "
             "useful Arts, by securing for limited Times to Authors"
@@ -113,7 +107,10 @@ class TestAdd:
         result = left + right
         assert len(result) == 2
 
-    def test_enactments_ordered_after_adding_groups(self, first_a, second_a, third_a):
+    def test_enactments_ordered_after_adding_groups(self, amendments):
+        first_a = amendments["I"]
+        second_a = amendments["II"]
+        third_a = amendments["III"]
         establishment_clause = first_a.select(
             "Congress shall make no law respecting an establishment of religion"
         )
@@ -1,4 +1,5 @@
 from datetime import date
+import json
 
 from anchorpoint import TextQuoteSelector
 import pytest
@@ -52,6 +53,43 @@ class TestUpdateEnactments:
         loaded_enactment = client.read_passage_from_json(updated_passage)
         assert loaded_enactment.selected_text() == "…person shall…"
 
+    @pytest.mark.vcr
+    def test_update_several_entries_in_enactment_index(self, test_client):
+        enactment_index = {
+            "security": {
+                "enactment": {
+                    "node": "/us/const/amendment/IV",
+                    "start_date": "1791-12-15",
+                },
+                "selection": {
+                    "quotes": [{"exact": "right of the people to be secure"}]
+                },
+            },
+            "speech": {
+                "enactment": {
+                    "node": "/us/const/amendment/I",
+                    "heading": "AMENDMENT I.",
+                    "start_date": "1791-12-15",
+                },
+                "selection": {"quotes": [{"exact": "freedom of speech"}]},
+            },
+            "person clause": {
+                "enactment": {"node": "/us/const/amendment/XIV/3"},
+                "selection": {
+                    "positions": [{"start": 3, "end": 15}],
+                },
+            },
+        }
+        updated_index = test_client.update_entries_in_enactment_index(enactment_index)
+        assert list(updated_index) == ["security", "speech", "person clause"]
+        security = updated_index["security"]["enactment"]
+        assert security["node"] == "/us/const/amendment/IV"
+        assert security["heading"] == "AMENDMENT IV."
+        assert "url" not in updated_index["speech"]["enactment"]
+        person_clause = updated_index["person clause"]["enactment"]
+        assert person_clause["node"] == "/us/const/amendment/XIV/3"
+        assert person_clause["heading"].startswith("Loyalty as a qualification")
+
     @pytest.mark.vcr
     def test_read_enactment_with_suffix_field(self, test_client):
         raw_enactment = {
@@ -92,12 +130,18 @@ class TestUpdateEnactments:
         assert passage.selected_text().startswith("The right")
 
 
-class TestLoadAndSelect:
+@pytest.fixture(scope="module")
+def usc_client():
+    """Client with preset USC coverage, so reading JSON makes no API request."""
     client = Client()
     client.coverage["/us/usc"] = {
         "earliest_in_db": date(1750, 1, 1),
         "first_published": date(1750, 1, 1),
     }
+    return client
+
+
+class TestLoadAndSelect:
     response = {
         "heading": "",
         "start_date": "2013-07-18",
@@ -157,14 +201,24 @@ class TestLoadAndSelect:
         "parent": "https://authorityspoke.com/api/v1/us/usc/t18/s1960/b/",
     }
 
-    def test_select_text_with_end_param(self):
-        law = self.client.read_from_json(self.response)
+    def test_select_text_with_end_param(self, usc_client):
+        law = usc_client.read_from_json(self.response)
         passage = law.select(
             TextQuoteSelector(suffix=", whether or not the defendant knew")
         )
         assert passage.selected_text().endswith("or a felony under State law…")
 
-    def test_end_param_has_no_effect_when_nothing_selected(self):
-        law = self.client.read_from_json(self.response)
+    def test_end_param_has_no_effect_when_nothing_selected(self, usc_client):
+        law = usc_client.read_from_json(self.response)
         passage = law.select(selection=False, end="or a felony under State law")
         assert passage.selected_text() == ""
+
+    def test_read_from_json_does_not_change_input(self, usc_client):
+        law = usc_client.read_from_json(self.response)
+        assert law.earliest_in_db == date(1750, 1, 1)
+        assert "earliest_in_db" not in self.response
+
+    def test_read_from_json_text(self, usc_client):
+        law = usc_client.read_from_json(json.dumps(self.response))
+        assert law.node == "/us/usc/t18/s1960/b/1"
+        assert law.children[2].content.startswith("otherwise involves")